@@ -2,7 +2,6 @@
 
 from dataclasses import dataclass
 from enum import Enum, Flag, auto
-from typing import Any
 
 from astrologer.categories import Influence
 
@@ -25,10 +24,11 @@ class AspectType(Flag):
     KEPLER = auto()
 
 
-@dataclass
+@dataclass(eq=False)
 class AspectDataMixin:
     """Additional properties of aspect."""
 
+    index: int
     title: str
     brief: str
     val: float
@@ -39,32 +39,31 @@ class AspectDataMixin:
 class Aspect(AspectDataMixin, Enum):
     """Aspect types."""
 
-    CONJUNCTION = "Conjunction", "cnj", 0, Influence.NEUTRAL, AspectType.MAJOR
-    VIGINTILE = "Vigintile", "vgt", 18, Influence.NEUTRAL, AspectType.KEPLER
-    QUINDECILE = "Quindecile", "qdc", 24, Influence.NEUTRAL, AspectType.KEPLER
-    SEMISEXTILE = "Semisextile", "ssx", 30, Influence.POSITIVE, AspectType.MINOR
-    DECILE = "Decile", "dcl", 36, Influence.NEUTRAL, AspectType.KEPLER
-    SEXTILE = "Sextile", "sxt", 60, Influence.POSITIVE, AspectType.MAJOR
-    SEMISQUARE = "Semisquare", "ssq", 45, Influence.NEGATIVE, AspectType.MINOR
-    QUINTILE = "Quintile", "qui", 72, Influence.NEUTRAL, AspectType.KEPLER
-    SQUARE = "Square", "sqr", 90, Influence.NEGATIVE, AspectType.MAJOR
-    TRIDECILE = "Tridecile", "tdc", 108, Influence.POSITIVE, AspectType.MINOR
-    TRINE = "Trine", "tri", 120, Influence.POSITIVE, AspectType.MAJOR
-    SESQUIQUADRATE = "Sesquiquadrate", "sqq", 135, Influence.NEGATIVE, AspectType.MINOR
-    BIQUINTILE = "Biquintile", "bqu", 144, Influence.NEUTRAL, AspectType.KEPLER
-    QUINCUNX = "Quincunx", "qcx", 150, Influence.NEGATIVE, AspectType.MINOR
-    OPPOSITION = "Opposition", "opp", 180, Influence.NEGATIVE, AspectType.MAJOR
-
-    def __eq__(self, other: Any) -> Any:
-        if not isinstance(other, Aspect):
-            return NotImplemented
-        return self.title == other.title
-
-    def __hash__(self) -> int:
-        return hash(self.title)
-
-
-@dataclass
+    CONJUNCTION = 0, "Conjunction", "cnj", 0, Influence.NEUTRAL, AspectType.MAJOR
+    VIGINTILE = 1, "Vigintile", "vgt", 18, Influence.NEUTRAL, AspectType.KEPLER
+    QUINDECILE = 2, "Quindecile", "qdc", 24, Influence.NEUTRAL, AspectType.KEPLER
+    SEMISEXTILE = 3, "Semisextile", "ssx", 30, Influence.POSITIVE, AspectType.MINOR
+    DECILE = 4, "Decile", "dcl", 36, Influence.NEUTRAL, AspectType.KEPLER
+    SEXTILE = 5, "Sextile", "sxt", 60, Influence.POSITIVE, AspectType.MAJOR
+    SEMISQUARE = 6, "Semisquare", "ssq", 45, Influence.NEGATIVE, AspectType.MINOR
+    QUINTILE = 7, "Quintile", "qui", 72, Influence.NEUTRAL, AspectType.KEPLER
+    SQUARE = 8, "Square", "sqr", 90, Influence.NEGATIVE, AspectType.MAJOR
+    TRIDECILE = 9, "Tridecile", "tdc", 108, Influence.POSITIVE, AspectType.MINOR
+    TRINE = 10, "Trine", "tri", 120, Influence.POSITIVE, AspectType.MAJOR
+    SESQUIQUADRATE = (
+        11,
+        "Sesquiquadrate",
+        "sqq",
+        135,
+        Influence.NEGATIVE,
+        AspectType.MINOR,
+    )
+    BIQUINTILE = 12, "Biquintile", "bqu", 144, Influence.NEUTRAL, AspectType.KEPLER
+    QUINCUNX = 13, "Quincunx", "qcx", 150, Influence.NEGATIVE, AspectType.MINOR
+    OPPOSITION = 14, "Opposition", "opp", 180, Influence.NEGATIVE, AspectType.MAJOR
+
+
+@dataclass(slots=True, frozen=True)
 class AspectInfo:
     """Aspect details."""
 
@@ -79,3 +78,11 @@ class AspectInfo:
     delta: float
     """difference between actual distance and exact aspect value (degrees).
     """
+
+
+ASPECTS_BY_TYPE: dict[int, tuple[Aspect, ...]] = {
+    flags: tuple(asp for asp in Aspect if asp.type.value & flags)
+    for flags in range(1 << len(AspectType))
+}
+"""Aspects for every combination of `AspectType` values.
+"""
@@ -12,13 +12,25 @@ __version__ = "0.0.1"
 
 from abc import ABC, abstractmethod
 from math import fabs
-
-from astropc.mathutils import shortest_arc_deg
+from operator import attrgetter
+from typing import Sequence
 
 from astrologer.objects import ChartObjectInfo, ChartObjectType
 
 from .aspects import Aspect, AspectInfo, AspectType
 
+# enum members in the order of their `index`, for building index-based tables
+_OBJECTS = tuple(sorted(ChartObjectType, key=attrgetter("index")))
+_ASPECTS = tuple(sorted(Aspect, key=attrgetter("index")))
+
+
+def _arc(a: float, b: float) -> float:
+    """Shortest arc between two longitudes in the range 0..360, arc-degrees.
+
+    Branch-free form of `shortest_arc_deg`.
+    """
+    return 180.0 - fabs(fabs(a - b) - 180.0)
+
 
 class OrbsMethod(ABC):
     """Base class for detecting an amount of leeway allowed in the measurement
@@ -28,6 +40,8 @@ class OrbsMethod(ABC):
 
     """
 
+    __slots__ = ("_name",)
+
     def __init__(self, name: str) -> None:
         self._name = name
 
@@ -57,6 +71,36 @@ class OrbsMethod(ABC):
             AspectInfo | None: aspect details if there is an aspect, otherwise `None`.
         """
 
+    def closest_aspect(
+        self,
+        source: ChartObjectInfo,
+        target: ChartObjectInfo,
+        aspects: Sequence[Aspect],
+        arc: float,
+    ) -> AspectInfo | None:
+        """Find the closest of given aspects between two objects.
+
+        Subclasses may override it with a faster equivalent of checking
+        every aspect with `is_aspect`; such overrides must then be kept in
+        sync with `is_aspect`.
+
+        Args:
+            source (ChartObjectInfo): source object
+            target (ChartObjectInfo): target object
+            aspects (Sequence[Aspect]): aspects to check
+            arc (float): arc between the objects.
+        Returns:
+            AspectInfo | None: details of the closest aspect, if any.
+        """
+        closest = None
+        for asp in aspects:
+            info = self.is_aspect(source, target, asp, arc)
+            if info is None:
+                continue
+            if closest is None or closest.delta > info.delta:
+                closest = info
+        return closest
+
 
 class Dariot(OrbsMethod):
     """Claude Dariot method, based on bodies in aspect.
@@ -86,8 +130,13 @@ class Dariot(OrbsMethod):
 
     default_moiety = 4.0
 
+    __slots__ = ("_orbs",)
+
     def __init__(self) -> None:
         super().__init__("Classic (Claude Dariot)")
+        moieties = [self.get_moiety(obj) for obj in _OBJECTS]
+        # orbs for every pair of objects, indexed by `ChartObjectType.index`
+        self._orbs = tuple(tuple((a + b) / 2.0 for b in moieties) for a in moieties)
 
     @classmethod
     def get_moiety(cls, obj: ChartObjectType) -> float:
@@ -111,9 +160,7 @@ class Dariot(OrbsMethod):
         Returns:
             float: orb in arc-degrees.
         """
-        a = self.get_moiety(src)
-        b = self.get_moiety(dst)
-        return (a + b) / 2.0
+        return self._orbs[src.index][dst.index]
 
     def check_aspect(self, aspect: Aspect, orb: float, arc: float) -> AspectInfo | None:
         """Check aspect using calculated orb.
@@ -140,7 +187,7 @@ class Dariot(OrbsMethod):
     ) -> AspectInfo | None:
         """See `OrbsMethod.is_aspect`"""
         if arc is None:
-            arc = shortest_arc_deg(source.position.lmbda, target.position.lmbda)
+            arc = _arc(source.position.lmbda, target.position.lmbda)
         orb = self.calculate_orb(source.type, target.type)
         return self.check_aspect(aspect, orb, arc)
 
@@ -170,8 +217,13 @@ class DeVore(OrbsMethod):
         Aspect.OPPOSITION: (174, 186),
     }
 
+    __slots__ = ("_lower", "_upper")
+
     def __init__(self) -> None:
         super().__init__("By Aspect (Nicholas deVore)")
+        # lower and upper bounds, indexed by `Aspect.index`
+        self._lower = tuple(self.ranges[asp][0] for asp in _ASPECTS)
+        self._upper = tuple(self.ranges[asp][1] for asp in _ASPECTS)
 
     def is_aspect(
         self,
@@ -182,9 +234,9 @@ class DeVore(OrbsMethod):
     ) -> AspectInfo | None:
         """See `OrbsMethod.is_aspect`"""
         if arc is None:
-            arc = shortest_arc_deg(source.position.lmbda, target.position.lmbda)
-        range = self.ranges[aspect]
-        if range[0] <= arc and range[1] >= arc:
+            arc = _arc(source.position.lmbda, target.position.lmbda)
+        i = aspect.index
+        if self._lower[i] <= arc <= self._upper[i]:
             return AspectInfo(aspect=aspect, arc=arc, delta=fabs(arc - aspect.val))
         return None
 
@@ -198,11 +250,22 @@ class ClassicWithAspectRatio(OrbsMethod):
     These coefficients may be set in the initizlizer.
     """
 
+    __slots__ = ("_minor_coeff", "_kepler_coeff", "_classic", "_coeffs")
+
     def __init__(self, minor_coeff: float = 0.6, kepler_coeff: float = 0.5) -> None:
         super().__init__("Classic with regard to Aspect type")
         self._minor_coeff = minor_coeff
         self._kepler_coeff = kepler_coeff
         self._classic = Dariot()
+        # orb coefficients, indexed by `Aspect.index`
+        self._coeffs = tuple(self._get_coeff(asp) for asp in _ASPECTS)
+
+    def _get_coeff(self, aspect: Aspect) -> float:
+        if aspect.type == AspectType.MINOR:
+            return self._minor_coeff
+        if aspect.type == AspectType.KEPLER:
+            return self._kepler_coeff
+        return 1.0
 
     def is_aspect(
         self,
@@ -213,10 +276,31 @@ class ClassicWithAspectRatio(OrbsMethod):
     ) -> AspectInfo | None:
         """See `OrbsMethod.is_aspect`"""
         if arc is None:
-            arc = shortest_arc_deg(source.position.lmbda, target.position.lmbda)
+            arc = _arc(source.position.lmbda, target.position.lmbda)
         orb = self._classic.calculate_orb(source.type, target.type)
-        if aspect.type == AspectType.MINOR:
-            orb *= self._minor_coeff
-        elif aspect.type == AspectType.KEPLER:
-            orb *= self._kepler_coeff
+        orb *= self._coeffs[aspect.index]
         return self._classic.check_aspect(aspect, orb, arc)
+
+    def closest_aspect(
+        self,
+        source: ChartObjectInfo,
+        target: ChartObjectInfo,
+        aspects: Sequence[Aspect],
+        arc: float,
+    ) -> AspectInfo | None:
+        """See `OrbsMethod.closest_aspect`
+
+        The orb of the pair is calculated only once. Aspects are checked with
+        the same `check_aspect` as `is_aspect` uses, but `is_aspect` itself is
+        not called, so a subclass overriding `is_aspect` must override this
+        method as well.
+        """
+        orb = self._classic.calculate_orb(source.type, target.type)
+        coeffs = self._coeffs
+        check_aspect = self._classic.check_aspect
+        closest = None
+        for asp in aspects:
+            info = check_aspect(asp, orb * coeffs[asp.index], arc)
+            if info is not None and (closest is None or info.delta < closest.delta):
+                closest = info
+        return closest
@@ -1,42 +1,96 @@
-import collections
+from itertools import combinations
 from operator import attrgetter
-from typing import Iterable
+from typing import Iterable, Iterator, Sequence
 
-from astropc.mathutils import diff_angle, shortest_arc_deg
-
-from astrologer.aspects.aspects import Aspect, AspectInfo, AspectType
-from astrologer.aspects.orbs import ClassicWithAspectRatio, OrbsMethod
+from astrologer.aspects.aspects import ASPECTS_BY_TYPE, AspectInfo, AspectType
+from astrologer.aspects.orbs import ClassicWithAspectRatio, OrbsMethod, _arc
 from astrologer.objects import ChartObjectInfo
 
+_DEFAULT_ORBS_METHOD = ClassicWithAspectRatio()
+
+
+def _pairwise_arcs(lons: Sequence[float]) -> list[list[float]]:
+    """Shortest arcs between every two longitudes, arc-degrees."""
+    n = len(lons)
+    arcs = [[0.0] * n for _ in range(n)]
+    for i in range(n - 1):
+        a = lons[i]
+        row = arcs[i]
+        for j in range(i + 1, n):
+            row[j] = arcs[j][i] = _arc(a, lons[j])
+    return arcs
+
+
+def _stellium_breaks(lons: Sequence[float], gap: float) -> list[bool]:
+    """For every longitude but the last, whether the next one starts a new group."""
+    return [(b - a) % 360.0 > gap for a, b in zip(lons, lons[1:])]
+
 
 def find_closest_aspect(
     source: ChartObjectInfo,
     target: ChartObjectInfo,
     orbs_method: OrbsMethod | None = None,
     type_flags: int = AspectType.MAJOR.value,
+    arc: float | None = None,
 ) -> AspectInfo | None:
     """Find closest aspect between two objects.
 
     Args:
         source (ChartObjectInfo): the first object.
         target (ChartObjectInfo): the second object.
+        orbs_method (OrbsMethod | None, optional): orbs method.
+            Defaults to `ClassicWithAspectRatio`.
+        type_flags (int, optional): types of aspects to check. Defaults to major aspects.
+        arc (float, optional): arc between the objects, if already known.
 
     Returns:
         AspectInfo | None: Aspect details, if any.
     """
     if orbs_method is None:
-        orbs_method = ClassicWithAspectRatio()
+        orbs_method = _DEFAULT_ORBS_METHOD
+
+    if arc is None:
+        arc = _arc(source.position.lmbda, target.position.lmbda)
+    aspects = ASPECTS_BY_TYPE[type_flags]
+    return orbs_method.closest_aspect(source, target, aspects, arc)
+
+
+def iter_aspects(
+    objects: Iterable[ChartObjectInfo],
+    orbs_method: OrbsMethod | None = None,
+    type_flags: int = AspectType.MAJOR.value,
+    *,
+    lons: Sequence[float] | None = None,
+) -> Iterator[tuple[ChartObjectInfo, ChartObjectInfo, AspectInfo]]:
+    """Find closest aspects between every pair of objects.
+
+    Longitudes and the list of aspects to check are gathered once,
+    so that each pair costs a single arc computation.
+
+    Args:
+        objects (Iterable[ChartObjectInfo]): celestial bodies.
+        orbs_method (OrbsMethod | None, optional): orbs method.
+            Defaults to `ClassicWithAspectRatio`.
+        type_flags (int, optional): types of aspects to check. Defaults to major aspects.
+        lons (Sequence[float], optional): longitudes of the objects, in the same order,
+            if already gathered.
+
+    Yields:
+        Iterator[tuple[ChartObjectInfo, ChartObjectInfo, AspectInfo]]: source,
+            target and aspect details for every pair in aspect.
+    """
+    if orbs_method is None:
+        orbs_method = _DEFAULT_ORBS_METHOD
 
-    closest = None
-    arc = shortest_arc_deg(source.position.lmbda, target.position.lmbda)
-    for asp in Aspect:
-        if asp.type.value & type_flags:
-            info = orbs_method.is_aspect(source, target, asp, arc)
-            if info is None:
-                continue
-            if closest is None or closest.delta > info.delta:
-                closest = info
-    return closest
+    objs = tuple(objects)
+    if lons is None:
+        lons = [obj.position.lmbda for obj in objs]
+    arcs = _pairwise_arcs(lons)
+    aspects = ASPECTS_BY_TYPE[type_flags]
+    for i, j in combinations(range(len(objs)), 2):
+        info = orbs_method.closest_aspect(objs[i], objs[j], aspects, arcs[i][j])
+        if info is not None:
+            yield objs[i], objs[j], info
 
 
 def iter_stelliums(
@@ -55,31 +109,20 @@ def iter_stelliums(
         Iterator[Iterable[tuple[ChartObjectInfo, ...]]]: stellium
     """
     sorted_objs = sorted(objects, key=attrgetter("position.lmbda"))
-    deq = collections.deque(sorted_objs)
-    for _ in range(len(sorted_objs)):
-        first = deq.popleft()
-        last = deq.pop()
-        if shortest_arc_deg(first.position.lmbda, last.position.lmbda) <= gap:
-            deq.insert(0, first)
-            deq.insert(0, last)
-        else:
-            deq.insert(0, first)
-            deq.append(last)
-            break
-    ordered_objs = list(deq)
-    last_idx = len(ordered_objs) - 1
-
-    group: list[ChartObjectInfo] | None = None
-
-    for idx, curr_obj in enumerate(ordered_objs):
-        if group is None:
-            group = []
-        group.append(curr_obj)
-        if idx < last_idx:
-            next_obj = ordered_objs[idx + 1]
-            if diff_angle(curr_obj.position.lmbda, next_obj.position.lmbda) > gap:
-                yield tuple(group)
-                group = None
-        else:
-            yield tuple(group)
-            group = None
+    lons = [obj.position.lmbda for obj in sorted_objs]
+    # gaps following every object, the last one wrapping around 0°
+    breaks = _stellium_breaks(lons + lons[:1], gap)
+    # start right after the last gap separating two groups, if any
+    start = next((i + 1 for i in reversed(range(len(breaks))) if breaks[i]), 0)
+    ordered_objs = sorted_objs[start:] + sorted_objs[:start]
+    breaks = breaks[start:] + breaks[:start]
+
+    if not ordered_objs:
+        return
+
+    # split the rotated sequence right after every break; the last
+    # object always closes a group
+    ends = [i + 1 for i, is_last in enumerate(breaks[:-1]) if is_last]
+    bounds = [0, *ends, len(ordered_objs)]
+    for begin, end in zip(bounds, bounds[1:]):
+        yield tuple(ordered_objs[begin:end])
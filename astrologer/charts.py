@@ -1,33 +1,30 @@
-# flake8: noqa F811
-# mypy: disable-error-code="empty-body,no-redef,assignment,index,return-value"
-
-
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, auto, unique
+from functools import cached_property, lru_cache
 from math import degrees, radians
-from typing import Iterable
+from typing import Callable, ClassVar, Iterable
 
-from astropc.mathutils import diff_angle
 from astropc.moon import apparent as apparent_moon
 from astropc.moon import lunar_node
 from astropc.planets import CelestialSphera, EclipticPosition, Planet
 from astropc.sun import apparent as apparent_sun
 from astropc.timeutils import djd_to_sidereal
 
-from astrologer.aspects.utils import find_closest_aspect
+from astrologer.aspects.utils import iter_aspects
 
 from .aspects import AspectInfo, AspectType, ClassicWithAspectRatio, OrbsMethod
 from .houses import (
     HousesSystem,
     equal_asc_cusps,
     equal_mc_cusps,
-    in_house,
+    in_houses,
     morinus_cusps,
     quadrant_cusps,
     signcusp_cusps,
 )
 from .objects import PLANET_TO_OBJECT, ChartObjectInfo, ChartObjectType
-from .points import SensitivePoints, ascendant, eastpoint, midheaven, vertex
+from .points import SensitivePoints, all_points
 
 __author__ = "ilbagatto"
 __license__ = "MIT"
@@ -35,8 +32,60 @@ __version__ = "0.0.1"
 
 
 AspectsTable = dict[ChartObjectType, dict[ChartObjectType, AspectInfo]]
+AspectsList = list[tuple[ChartObjectType, ChartObjectType, AspectInfo]]
 ObjectsDict = dict[ChartObjectType, ChartObjectInfo]
 
+_PLANETS: tuple[tuple[Planet, ChartObjectType], ...] = tuple(
+    (Planet.for_id(id), obj_type) for id, obj_type in PLANET_TO_OBJECT.items()
+)
+_OBJECT_TYPES: tuple[ChartObjectType, ...] = (
+    ChartObjectType.MOON,
+    ChartObjectType.SUN,
+    *(obj_type for _, obj_type in _PLANETS),
+    ChartObjectType.NODE,
+)
+
+
+# Keys of the caches below are rounded to avoid misses caused by
+# floating point noise in otherwise equal moments.
+_KEY_DIGITS = 9
+
+
+@lru_cache(maxsize=4096)
+def _cached_sphera(djd: float) -> CelestialSphera:
+    """Celestial sphera, shared by charts for the same moment."""
+    return CelestialSphera.create(djd, apparent=True)
+
+
+@lru_cache(maxsize=2048)
+def _cached_sidereal(djd: float, lng: float) -> float:
+    """Local sidereal time, shared by charts for the same moment and place."""
+    return djd_to_sidereal(djd, lng=lng)
+
+
+@lru_cache(maxsize=4096)
+def _cached_bodies(djd: float) -> tuple[tuple[float, float, float], ...]:
+    """Positions of the Sun and the planets, in `_PLANETS` order.
+
+    A chart needs them for its own moment and for the next day, so
+    charts taken one day apart share half of the work. Positions are
+    kept as `(lmbda, beta, delta)` tuples; every chart builds its own
+    `EclipticPosition` instances from them.
+    """
+    sphera = _cached_sphera(djd)
+    sun = apparent_sun(djd, dpsi=sphera.nutation.dpsi, ignore_light_travel=False)
+    planets = (pla.geocentric_position(sphera) for pla, _ in _PLANETS)
+    return (
+        (sun.phi, 0.0, sun.rho),
+        *((pos.lmbda, pos.beta, pos.delta) for pos in planets),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _cached_node(djd: float, true_node: bool) -> float:
+    """Longitude of the lunar node, shared by charts for the same moment."""
+    return lunar_node(djd, true_node=true_node)
+
 
 @unique
 class ChartType(Enum):
@@ -51,15 +100,15 @@ class ChartType(Enum):
     RELATIONSHIP = auto()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Settings:
     houses: HousesSystem = HousesSystem.PLACIDUS
     orbs_method: OrbsMethod = ClassicWithAspectRatio()
-    aspect_types = AspectType.MAJOR
     true_node: bool = True
+    aspect_types: AspectType = AspectType.MAJOR
 
 
-class BaseChart:
+class BaseChart(ABC):
     """Base class for charts."""
 
     def __init__(self, name: str, charttype: ChartType) -> None:
@@ -86,6 +135,7 @@ class BaseChart:
         return self._name
 
     @property
+    @abstractmethod
     def objects(self) -> ObjectsDict:
         """
         Returns:
@@ -93,6 +143,7 @@ class BaseChart:
         """
 
     @property
+    @abstractmethod
     def aspects(self) -> AspectsTable:
         """
         Returns:
@@ -100,6 +151,16 @@ class BaseChart:
         """
 
     @property
+    @abstractmethod
+    def aspects_flat(self) -> AspectsList:
+        """Aspects, one entry per pair of objects.
+
+        Returns:
+            AspectsList: source type, target type and aspect details.
+        """
+
+    @property
+    @abstractmethod
     def houses(self) -> tuple[float, ...]:
         """
         Returns:
@@ -107,6 +168,7 @@ class BaseChart:
         """
 
     @property
+    @abstractmethod
     def settings(self) -> Settings:
         """
         Returns:
@@ -114,6 +176,7 @@ class BaseChart:
         """
 
     @property
+    @abstractmethod
     def points(self) -> SensitivePoints:
         """Sensitive points.
 
@@ -122,7 +185,7 @@ class BaseChart:
         """
 
 
-@dataclass
+@dataclass(slots=True)
 class Place:
     name: str
     latitude: float
@@ -143,12 +206,28 @@ class Radix(BaseChart):
         self._djd = djd
         self._place = place
         self._settings = settings
-        self._objects = None
-        self._aspects = None
-        self._houses = None
-        self._points = None
-        self._sphera = None
-        self._lst = None
+
+    @classmethod
+    def bulk_objects(
+        cls, djds: Iterable[float], place: Place, settings: Settings | None = None
+    ) -> list[ObjectsDict]:
+        """Chart objects for a series of moments at the same place.
+
+        Positions computed for the daily motions of one chart are reused by
+        the chart for the next day, so day-by-day series are cheaper than
+        independent charts.
+
+        Args:
+            djds (Iterable[float]): numbers of Julian days since 1900 Jan. 0.5.
+            place (Place): geographic position.
+            settings (Settings | None, optional): chart settings. Defaults to None.
+
+        Returns:
+            list[ObjectsDict]: chart objects for every moment, in the same order.
+        """
+        if settings is None:
+            settings = Settings()
+        return [cls("", djd, place, settings).objects for djd in djds]
 
     @property
     def djd(self) -> float:
@@ -176,175 +255,177 @@ class Radix(BaseChart):
         """
         return self._settings
 
-    def _calculate_houses(self) -> tuple[float, ...]:
-        hsys = self._settings.houses
-        match hsys:
-            case (
-                HousesSystem.PLACIDUS
-                | HousesSystem.KOCH
-                | HousesSystem.REGIOMONTANUS
-                | HousesSystem.CAMPANUS
-                | HousesSystem.TOPOCENTRIC
-            ):
-                return quadrant_cusps(
-                    hsys,
-                    ramc=radians(self.sidereal_time * 15),
-                    eps=radians(self.sphera.obliquity),
-                    theta=radians(
-                        self.place.latitude,
-                    ),
-                    asc=radians(self.points.asc),
-                    mc=radians(self.points.mc),
-                )
-            case HousesSystem.MORINUS:
-                return morinus_cusps(
-                    ramc=radians(self.sidereal_time * 15),
-                    eps=radians(self.sphera.obliquity),
-                )
-            case HousesSystem.EQUAL_ASC:
-                return equal_asc_cusps(radians(self.points.asc))
-            case HousesSystem.EQUAL_MC:
-                return equal_mc_cusps(radians(self.points.mc))
-            case HousesSystem.EQUAL_SIGNCUSP:
-                return signcusp_cusps()
+    def _quadrant_houses(self) -> tuple[float, ...]:
+        return quadrant_cusps(
+            self._settings.houses,
+            ramc=self.ramc,
+            eps=self._eps,
+            theta=self._theta,
+            asc=self._points_rad.asc,
+            mc=self._points_rad.mc,
+        )
 
-    def _calculate_objects(self) -> Iterable[ChartObjectInfo]:
-        next_djd = self._djd + 1
-        sphera = self.sphera
-        cusps = self.houses
+    def _morinus_houses(self) -> tuple[float, ...]:
+        return morinus_cusps(ramc=self.ramc, eps=self._eps)
 
-        next_sphera = CelestialSphera.create(next_djd, apparent=True)
+    def _equal_asc_houses(self) -> tuple[float, ...]:
+        return equal_asc_cusps(self._points_rad.asc)
 
-        moo = apparent_moon(self._djd)
-        yield ChartObjectInfo(
-            type=ChartObjectType.MOON,
-            position=EclipticPosition(lmbda=moo.lmbda, beta=moo.beta, delta=moo.delta),
-            daily_motion=moo.motion,
-            house=in_house(moo.lmbda, cusps),
-        )
+    def _equal_mc_houses(self) -> tuple[float, ...]:
+        return equal_mc_cusps(self._points_rad.mc)
 
-        sun = apparent_sun(
-            self._djd, dpsi=sphera.nutation.dpsi, ignore_light_travel=False
-        )
-        next_sun = apparent_sun(
-            next_djd, dpsi=next_sphera.nutation.dpsi, ignore_light_travel=False
-        )
-        yield ChartObjectInfo(
-            type=ChartObjectType.SUN,
-            position=EclipticPosition(lmbda=sun.phi, delta=sun.rho),
-            daily_motion=diff_angle(sun.phi, next_sun.phi),
-            house=in_house(sun.phi, cusps),
-        )
+    def _signcusp_houses(self) -> tuple[float, ...]:
+        return signcusp_cusps()
+
+    _HOUSES_DISPATCH: ClassVar[
+        dict[HousesSystem, Callable[["Radix"], tuple[float, ...]]]
+    ] = {
+        HousesSystem.PLACIDUS: _quadrant_houses,
+        HousesSystem.KOCH: _quadrant_houses,
+        HousesSystem.REGIOMONTANUS: _quadrant_houses,
+        HousesSystem.CAMPANUS: _quadrant_houses,
+        HousesSystem.TOPOCENTRIC: _quadrant_houses,
+        HousesSystem.MORINUS: _morinus_houses,
+        HousesSystem.EQUAL_ASC: _equal_asc_houses,
+        HousesSystem.EQUAL_MC: _equal_mc_houses,
+        HousesSystem.EQUAL_SIGNCUSP: _signcusp_houses,
+    }
+
+    def _calculate_houses(self) -> tuple[float, ...]:
+        return self._HOUSES_DISPATCH[self._settings.houses](self)
 
-        for id, obj_type in PLANET_TO_OBJECT.items():
-            pla = Planet.for_id(id)
-            pos = pla.geocentric_position(sphera)
-            next_pos = pla.geocentric_position(next_sphera)
+    def _calculate_objects(self) -> Iterable[ChartObjectInfo]:
+        positions, motions = self._ephemeris
+        houses = in_houses(self._lons, self.houses)
+        for obj_type, pos, motion, house in zip(
+            _OBJECT_TYPES, positions, motions, houses
+        ):
             yield ChartObjectInfo(
-                type=obj_type,
-                position=pos,
-                daily_motion=diff_angle(pos.lmbda, next_pos.lmbda),
-                house=in_house(pos.lmbda, cusps),
+                type=obj_type, position=pos, daily_motion=motion, house=house
             )
 
-        node = lunar_node(self._djd, true_node=self.settings.true_node)
-        next_node = lunar_node(next_djd, true_node=self.settings.true_node)
-        yield ChartObjectInfo(
-            type=ChartObjectType.NODE,
-            position=EclipticPosition(lmbda=node),
-            daily_motion=diff_angle(node, next_node),
-            house=in_house(node, cusps),
+    def _calculate_aspects(self) -> AspectsList:
+        pairs = iter_aspects(
+            self.objects.values(),
+            orbs_method=self.settings.orbs_method,
+            type_flags=self.settings.aspect_types.value,
+            lons=self._lons,
         )
+        return [(src.type, dst.type, asp) for src, dst, asp in pairs]
 
-    def _calculate_aspects(
-        self,
-    ) -> dict[ChartObjectType, dict[ChartObjectType, AspectInfo]]:
-        aspects: dict[ChartObjectType, dict[ChartObjectType, AspectInfo]] = {}
-        method = self.settings.orbs_method
-        flags = self.settings.aspect_types
-        objs = self.objects
-        keys = list(self.objects.keys())
-        sz = len(keys)
-        for i in range(0, sz - 1):
-            src = objs[keys[i]]
-            for j in range(i + 1, sz):
-                dst = objs[keys[j]]
-                asp = find_closest_aspect(
-                    src, dst, orbs_method=method, type_flags=flags.value
-                )
-                if asp is not None:
-                    aspects.setdefault(src.type, {})[dst.type] = asp
-                    aspects.setdefault(dst.type, {})[src.type] = asp
-        return aspects
-
-    @property
+    @cached_property
     def sphera(self) -> CelestialSphera:
-        if self._sphera is None:
-            self._sphera = CelestialSphera.create(self._djd, apparent=True)
-        return self._sphera
+        """Celestial sphera for the moment of the chart.
 
-    @property
+        The instance is cached at module level and shared by every chart
+        built for the same moment, so it must be treated as read-only.
+
+        Returns:
+            CelestialSphera: shared celestial sphera.
+        """
+        return _cached_sphera(round(self._djd, _KEY_DIGITS))
+
+    @cached_property
     def sidereal_time(self) -> float:
-        if self._lst is None:
-            self._lst = djd_to_sidereal(self._djd, lng=self.place.longitude)
-        return self._lst
+        return _cached_sidereal(
+            round(self._djd, _KEY_DIGITS), round(self.place.longitude, _KEY_DIGITS)
+        )
 
-    @property
+    @cached_property
+    def ramc(self) -> float:
+        """Right ascension of the meridian.
+
+        Returns:
+            float: RAMC in radians.
+        """
+        return radians(self.sidereal_time * 15)
+
+    @cached_property
+    def _eps(self) -> float:
+        return radians(self.sphera.obliquity)
+
+    @cached_property
+    def _theta(self) -> float:
+        return radians(self.place.latitude)
+
+    @cached_property
+    def _points_rad(self) -> SensitivePoints:
+        return all_points(self.ramc, self._eps, self._theta)
+
+    @cached_property
+    def _ephemeris(self) -> tuple[list[EclipticPosition], list[float]]:
+        """Positions and daily motions of the chart objects, in `_OBJECT_TYPES` order."""
+        key = round(self._djd, _KEY_DIGITS)
+        next_key = round(self._djd + 1, _KEY_DIGITS)
+
+        moo = apparent_moon(self._djd)
+        positions = [EclipticPosition(lmbda=moo.lmbda, beta=moo.beta, delta=moo.delta)]
+        positions.extend(
+            EclipticPosition(lmbda=lmbda, beta=beta, delta=delta)
+            for lmbda, beta, delta in _cached_bodies(key)
+        )
+        # longitudes a day later, for every object but the Moon
+        next_lons = [lmbda for lmbda, _, _ in _cached_bodies(next_key)]
+
+        true_node = self.settings.true_node
+        positions.append(EclipticPosition(lmbda=_cached_node(key, true_node)))
+        next_lons.append(_cached_node(next_key, true_node))
+
+        # daily motions in the range -180..+180, like astropc's diff_angle
+        motions = [moo.motion]
+        motions.extend(
+            (b - a.lmbda + 540.0) % 360.0 - 180.0
+            for a, b in zip(positions[1:], next_lons)
+        )
+        return positions, motions
+
+    @cached_property
+    def _lons(self) -> list[float]:
+        """Longitudes of the chart objects, shared by houses and aspects lookups."""
+        return [pos.lmbda for pos in self._ephemeris[0]]
+
+    @cached_property
     def objects(self) -> ObjectsDict:
         """
         Returns:
             ObjectsDict: chart objects.
         """
-        if self._objects is None:
-            self._objects: ObjectsDict = {}
-            for obj in self._calculate_objects():
-                self._objects[obj.type] = obj
-
-        return self._objects
+        return {obj.type: obj for obj in self._calculate_objects()}
 
-    @property
+    @cached_property
     def aspects(self) -> AspectsTable:
         """
         Returns:
             dict[ChartObjectType, dict[ChartObjectType, AspectInfo]]: aspects.
         """
-        if self._aspects is None:
-            self._aspects = self._calculate_aspects()
-        return self._aspects
+        aspects: AspectsTable = {}
+        for src, dst, asp in self.aspects_flat:
+            aspects.setdefault(src, {})[dst] = asp
+            aspects.setdefault(dst, {})[src] = asp
+        return aspects
+
+    @cached_property
+    def aspects_flat(self) -> AspectsList:
+        """Aspects, one entry per pair of objects.
 
-    @property
-    def houses(self) -> tuple[float, ...]:
-        """
         Returns:
-            tuple[float, ...]: houses cusps, arc-degrees.
+            AspectsList: source type, target type and aspect details.
         """
-        if self._houses is None:
-            self._houses = self._calculate_houses()
-        return self._houses
+        return self._calculate_aspects()
 
-    @property
-    def settings(self) -> Settings:
+    @cached_property
+    def houses(self) -> tuple[float, ...]:
         """
         Returns:
-            Settings: chart settings.
+            tuple[float, ...]: houses cusps, arc-degrees.
         """
-        return self._settings
+        return self._calculate_houses()
 
-    @property
+    @cached_property
     def points(self) -> SensitivePoints:
         """Sensitive points.
 
         Returns:
             SensitivePoints: longitudes of sensitive points in degrees.
         """
-        if self._points is None:
-            ramc = radians(self.sidereal_time * 15)
-            eps = radians(self.sphera.obliquity)
-            theta = radians(self.place.latitude)
-            self._points = SensitivePoints(
-                asc=degrees(ascendant(ramc, eps, theta)),
-                mc=degrees(midheaven(ramc, eps)),
-                vertex=degrees(vertex(ramc, eps, theta)),
-                eastpoint=degrees(eastpoint(ramc, eps)),
-            )
-        return self._points
+        return SensitivePoints._make(degrees(x) for x in self._points_rad)
@@ -17,11 +17,12 @@ __author__ = "ilbagatto"
 __license__ = "MIT"
 __version__ = "0.0.1"
 
+from bisect import bisect_right
+from dataclasses import dataclass
 from enum import StrEnum
-from math import acos, asin, atan2, cos, degrees, fabs, pi, sin, tan
-from typing import Iterator
-
-from astropc.mathutils import reduce_deg, reduce_rad, shortest_arc_rad
+from functools import lru_cache
+from math import acos, asin, atan2, cos, degrees, fabs, hypot, pi, sin, sqrt, tan
+from typing import Iterable
 
 from astrologer.points import ascendant, midheaven
 
@@ -31,11 +32,22 @@ _R60 = 1.0471975511965976
 _R90 = 1.5707963267948966
 _R120 = 2.0943951023931953
 _R150 = 2.6179938779914944
+_R360 = 6.283185307179586
 
 
 _PLACIDUS_ARGS = ((10, 3.0, _R30), (11, 1.5, _R60), (1, 1.5, _R120), (2, 3.0, _R150))
 _PLAC_DELTA = 1e-4
+_PLAC_MAX_STEPS = 16
+_PLAC_MAX_FIXED_STEPS = 1000
+# Newton's step is not used where 1 - u² falls below this, i.e. near |u| = 1
+_PLAC_MIN_DENOM = 1e-12
 _TOPOCENTRIC_ARGS = ((-_R60, 1.0), (-_R30, 2.0), (_R30, 2), (_R60, 1.0))
+# sines and cosines of the hour angles of the intermediate cusps
+_HOUR_ANGLES = tuple((sin(h), cos(h)) for h in (_R30, _R60, _R120, _R150))
+# sines and cosines of Morinus offsets from RAMC, cusps 1-12
+_MORINUS_ANGLES = tuple(
+    (sin(a), cos(a)) for a in (_R60 + _R30 * (i + 1) for i in range(12))
+)
 
 
 class HousesSystem(StrEnum):
@@ -50,31 +62,125 @@ class HousesSystem(StrEnum):
     EQUAL_MC = "Equal from MC"
 
 
-def placidus_cusps(*, ramc: float, eps: float, theta: float) -> Iterator[float]:
+@dataclass(frozen=True, slots=True)
+class _TrigCtx:
+    """Obliquity and latitude with their trigonometric functions.
+
+    Computed once and shared by the quadrant systems.
+    """
+
+    cs_eps: float
+    sn_eps: float
+    tn_eps: float
+    cs_the: float
+    sn_the: float
+    tn_the: float
+
+    @classmethod
+    def create(cls, eps: float, theta: float) -> "_TrigCtx":
+        return cls(
+            cs_eps=cos(eps),
+            sn_eps=sin(eps),
+            tn_eps=tan(eps),
+            cs_the=cos(theta),
+            sn_the=sin(theta),
+            tn_the=tan(theta),
+        )
+
+
+def _ascendant(ramc: float, ctx: _TrigCtx, tn_the: float) -> float:
+    """Same as `points.ascendant`, given tangent of the latitude."""
+    return atan2(cos(ramc), -sin(ramc) * ctx.cs_eps - tn_the * ctx.sn_eps) % _R360
+
+
+def _placidus_fixed_point(r: float, kf: float, ktt: float, x0: float) -> float:
+    """Root of the Placidus equation by the slower fixed-point iteration.
+
+    Raises:
+        ValueError: if the iteration does not converge.
+    """
+    last_x = x0
+    for _ in range(_PLAC_MAX_FIXED_STEPS):
+        x = r - kf * acos(ktt * sin(last_x))
+        d = fabs(x - last_x)
+        if d > pi:
+            d = _R360 - d
+        if d < _PLAC_DELTA:
+            return last_x
+        last_x = x
+    raise ValueError("Placidus iteration does not converge")
+
+
+def _placidus_newton(r: float, kf: float, ktt: float, x0: float) -> float:
+    """Root of g(x) = x - r + kf * acos(ktt * sin(x)) by Newton's method.
+
+    Falls back to the fixed-point iteration when the derivative is
+    undefined (|ktt * sin(x)| close to 1) or the steps do not converge.
+    """
+    x = x0
+    for _ in range(_PLAC_MAX_STEPS):
+        u = ktt * sin(x)
+        w = 1 - u * u
+        if w < _PLAC_MIN_DENOM:
+            break
+        dg = 1 - kf * ktt * cos(x) / sqrt(w)
+        if dg == 0.0:
+            break
+        step = (x - r + kf * acos(u)) / dg
+        x -= step
+        if fabs(step) < _PLAC_DELTA:
+            return x
+    return _placidus_fixed_point(r, kf, ktt, x0)
+
+
+def _placidus_core(ramc: float, tt: float) -> tuple[float, float, float, float]:
+    """Right ascensions of Placidus cusps 11, 12, 2, 3 in radians.
+
+    `tt` is the product of tangents of the latitude and the obliquity.
+    """
+    ras = []
+    for i, f, x0 in _PLACIDUS_ARGS:
+        k, r = (-1, ramc) if i in (10, 11) else (1, ramc + pi)
+        ras.append(_placidus_newton(r, k / f, k * tt, x0 + ramc))
+    return ras[0], ras[1], ras[2], ras[3]
+
+
+def _placidus(ramc: float, ctx: _TrigCtx) -> tuple[float, ...]:
+    cs_eps = ctx.cs_eps
+    ras = _placidus_core(ramc, ctx.tn_the * ctx.tn_eps)
+    return tuple([atan2(sin(x), cs_eps * cos(x)) % _R360 for x in ras])
+
+
+def placidus_cusps(*, ramc: float, eps: float, theta: float) -> tuple[float, ...]:
     """Calculate house cusps using Placidus method.
 
     Args:
          ramc (float): Right ascension of the Meridian, radians.
          eps (float): Obliquity of the ecliptic in radians.
          theta (float): Geographic latitude in radians, positive northwards.
-    Yields:
-        Iterator[float]: longitude of the base cusps (11, 12, 2, 3) in radians
+    Returns:
+        tuple[float, ...]: longitudes of the base cusps (11, 12, 2, 3) in radians
+    Raises:
+        ValueError: if the cusps are undefined or cannot be found,
+            as happens above the polar circles.
     """
-    tt = tan(theta) * tan(eps)
-    cs_eps = cos(eps)
+    return _placidus(ramc, _TrigCtx.create(eps, theta))
 
-    for i, f, x0 in _PLACIDUS_ARGS:
-        k, r = (-1, ramc) if i in (10, 11) else (1, ramc + pi)
-        last_x = x0 + ramc
-        while True:
-            x = r - k * (acos(k * sin(last_x) * tt)) / f
-            if abs(shortest_arc_rad(x, last_x)) < _PLAC_DELTA:
-                break
-            last_x = x
-        yield reduce_rad(atan2(sin(last_x), cs_eps * cos(last_x)))
+
+def _koch(ramc: float, ctx: _TrigCtx, mc: float) -> tuple[float, ...]:
+    u = sin(mc) * ctx.sn_eps
+    # tan(asin(u)) == u / sqrt(1 - u²)
+    k = asin(ctx.tn_the * u / sqrt(1 - u * u))
+    k1 = k / 3
+    k2 = k1 * 2
+    tn_the = ctx.tn_the
+    offsets = (-_R60 - k2, -_R30 - k1, _R30 + k1, _R60 + k2)
+    return tuple([_ascendant(ramc + x, ctx, tn_the) for x in offsets])
 
 
-def koch_cusps(*, ramc: float, eps: float, theta: float, mc: float) -> Iterator[float]:
+def koch_cusps(
+    *, ramc: float, eps: float, theta: float, mc: float
+) -> tuple[float, ...]:
     """Calculate house cusps using Koch method.
 
     Args:
@@ -83,21 +189,29 @@ def koch_cusps(*, ramc: float, eps: float, theta: float, mc: float) -> Iterator[
         theta (float): Geographic latitude in radians, positive northwards.
         mc (float): MC in radians.
 
-    Yields:
-        Iterator[float]: longitude of the base cusps (11, 12, 2, 3) in radians
+    Returns:
+        tuple[float, ...]: longitudes of the base cusps (11, 12, 2, 3) in radians
     """
-    tn_theta = tan(theta)
-    sn_eps = sin(eps)
-    sn_mc = sin(mc)
-    k = asin(tn_theta * tan(asin(sn_mc * sn_eps)))
-    k1 = k / 3
-    k2 = k1 * 2
-    offsets = [-_R60 - k2, -_R30 - k1, _R30 + k1, _R60 + k2]
-    for x in offsets:
-        yield ascendant(ramc + x, eps, theta)
+    return _koch(ramc, _TrigCtx.create(eps, theta), mc)
 
 
-def regiomontanus_cusps(*, ramc: float, eps: float, theta: float) -> Iterator[float]:
+def _regiomontanus(ramc: float, ctx: _TrigCtx) -> tuple[float, ...]:
+    # sin/cos of (ramc + h) by the angle addition formulae; the auxiliary
+    # angle r = atan2(sin(h) * tan(theta), cos(ramc + h)) is folded into
+    # the final atan2, which does not depend on the common positive scale
+    sn_r = sin(ramc)
+    cs_r = cos(ramc)
+    cs_eps = ctx.cs_eps
+    y_eps = ctx.tn_the * ctx.sn_eps
+    cusps = []
+    for sn_h, cs_h in _HOUR_ANGLES:
+        sn_rh = sn_r * cs_h + cs_r * sn_h
+        cs_rh = cs_r * cs_h - sn_r * sn_h
+        cusps.append(atan2(sn_rh, cs_rh * cs_eps - sn_h * y_eps) % _R360)
+    return tuple(cusps)
+
+
+def regiomontanus_cusps(*, ramc: float, eps: float, theta: float) -> tuple[float, ...]:
     """Calculate house cusps using Regio-Montanus method.
 
     Args:
@@ -105,49 +219,66 @@ def regiomontanus_cusps(*, ramc: float, eps: float, theta: float) -> Iterator[fl
         eps (float): Obliquity of the ecliptic in radians.
         theta (float): Geographic latitude in radians, positive northwards.
 
-    Yields:
-        Iterator[float]: longitude of the base cusps (11, 12, 2, 3) in radians
+    Returns:
+        tuple[float, ...]: longitudes of the base cusps (11, 12, 2, 3) in radians
     """
-    tn_theta = tan(theta)
-    for h in (_R30, _R60, _R120, _R150):
-        rh = ramc + h
-        r = atan2(sin(h) * tn_theta, cos(rh))
-        yield reduce_rad(atan2(cos(r) * tan(rh), cos(r + eps)))
+    return _regiomontanus(ramc, _TrigCtx.create(eps, theta))
+
+
+def _campanus(ramc: float, ctx: _TrigCtx) -> tuple[float, ...]:
+    # d = ramc + 90° - atan2(cos(h), sin(h) * cos(theta)) and the auxiliary
+    # angle c are expanded into sines and cosines of ramc and h, then folded
+    # into the final atan2, which does not depend on the common positive scale
+    sn_r = sin(ramc)
+    cs_r = cos(ramc)
+    sn_the = ctx.sn_the
+    cs_the = ctx.cs_the
+    cs_eps = ctx.cs_eps
+    sn_eps = ctx.sn_eps
+    cusps = []
+    for sn_h, cs_h in _HOUR_ANGLES:
+        x = sn_h * cs_the
+        sn_d = cs_r * x + sn_r * cs_h
+        cs_d = cs_r * cs_h - sn_r * x
+        u = sn_the * sn_h
+        # tan(c) * cos(d) == tan(asin(u)) == u / sqrt(1 - u²)
+        y = hypot(cs_h, x) * u / sqrt(1 - u * u)
+        cusps.append(atan2(sn_d, cs_d * cs_eps - y * sn_eps) % _R360)
+    return tuple(cusps)
 
 
-def campanus_cusps(*, ramc: float, eps: float, theta: float) -> Iterator[float]:
+def campanus_cusps(*, ramc: float, eps: float, theta: float) -> tuple[float, ...]:
     """Calculate house cusps using Campanus method.
 
     Args:
         ramc (float): Right ascension of the Meridian, radians.
         eps (float): Obliquity of the ecliptic in radians.
         theta (float): Geographic latitude in radians, positive northwards.
-    Yields:
-        Iterator[float]: longitude of the base cusps (11, 12, 2, 3) in radians
+    Returns:
+        tuple[float, ...]: longitudes of the base cusps (11, 12, 2, 3) in radians
     """
-    rm90 = ramc + _R90
-    sn_the = sin(theta)
-    cs_the = cos(theta)
-    for h in (_R30, _R60, _R120, _R150):
-        sn_h = sin(h)
-        d = rm90 - atan2(cos(h), sn_h * cs_the)
-        c = atan2(tan(asin(sn_the * sn_h)), cos(d))
-        yield reduce_rad(atan2(tan(d) * cos(c), cos(c + eps)))
+    return _campanus(ramc, _TrigCtx.create(eps, theta))
+
+
+def _topocentric(ramc: float, ctx: _TrigCtx) -> tuple[float, ...]:
+    tn_the = ctx.tn_the
+    # n * tn_the / 3 is the tangent of the latitude atan2(n * tn_the, 3)
+    return tuple(
+        [_ascendant(ramc + x, ctx, n * tn_the / 3) for x, n in _TOPOCENTRIC_ARGS]
+    )
 
 
-def topocentric_cusps(*, ramc: float, eps: float, theta: float) -> Iterator[float]:
+def topocentric_cusps(*, ramc: float, eps: float, theta: float) -> tuple[float, ...]:
     """Calculate house cusps using Topocentric method.
 
     Args:
         ramc (float): Right ascension of the Meridian, radians.
         eps (float): Obliquity of the ecliptic in radians.
         theta (float): Geographic latitude in radians, positive northwards.
-    Yields:
-        Iterator[float]: longitude of the base cusps (11, 12, 2, 3) in radians
+    Returns:
+        tuple[float, ...]: longitudes of the base cusps (11, 12, 2, 3) in radians
     """
-    tn_the = tan(theta)
-    for x, n in _TOPOCENTRIC_ARGS:
-        yield ascendant(ramc + x, eps, atan2(n * tn_the, 3))
+    return _topocentric(ramc, _TrigCtx.create(eps, theta))
 
 
 def quadrant_cusps(
@@ -192,30 +323,30 @@ def quadrant_cusps(
     if asc is None:
         asc = ascendant(ramc, eps, theta)
 
+    ctx = _TrigCtx.create(eps, theta)
     match system:
         case HousesSystem.KOCH:
-            iter = koch_cusps(ramc=ramc, eps=eps, theta=theta, mc=mc)
+            base = _koch(ramc, ctx, mc)
         case HousesSystem.PLACIDUS:
-            iter = placidus_cusps(ramc=ramc, eps=eps, theta=theta)
+            base = _placidus(ramc, ctx)
         case HousesSystem.REGIOMONTANUS:
-            iter = regiomontanus_cusps(ramc=ramc, eps=eps, theta=theta)
+            base = _regiomontanus(ramc, ctx)
         case HousesSystem.CAMPANUS:
-            iter = campanus_cusps(ramc=ramc, eps=eps, theta=theta)
+            base = _campanus(ramc, ctx)
         case HousesSystem.TOPOCENTRIC:
-            iter = topocentric_cusps(ramc=ramc, eps=eps, theta=theta)
+            base = _topocentric(ramc, ctx)
         case _:
             raise ValueError(f"{system} is not a topocentric system")
-    base = list(iter)
     all_cusps = (
         asc,
         base[2],
         base[3],
-        reduce_rad(mc + pi),
-        reduce_rad(base[0] + pi),
-        reduce_rad(base[1] + pi),
-        reduce_rad(asc + pi),
-        reduce_rad(base[2] + pi),
-        reduce_rad(base[3] + pi),
+        (mc + pi) % _R360,
+        (base[0] + pi) % _R360,
+        (base[1] + pi) % _R360,
+        (asc + pi) % _R360,
+        (base[2] + pi) % _R360,
+        (base[3] + pi) % _R360,
         mc,
         base[0],
         base[1],
@@ -234,16 +365,19 @@ def morinus_cusps(ramc: float, eps: float) -> tuple[float, ...]:
         tuple[float, ...]:  longitudes of cusps 1-12 in arc-degrees.
     """
     cs_eps = cos(eps)
+    sn_r = sin(ramc)
+    cs_r = cos(ramc)
+    # sin/cos of (ramc + a) by the angle addition formulae
     cusps = []
-    for i in range(12):
-        r = ramc + _R60 + _R30 * (i + 1)
-        y = sin(r) * cs_eps
-        x = cos(r)
-        cusps.append(reduce_deg(degrees(atan2(y, x))))
+    for sn_a, cs_a in _MORINUS_ANGLES:
+        y = (sn_r * cs_a + cs_r * sn_a) * cs_eps
+        x = cs_r * cs_a - sn_r * sn_a
+        cusps.append(degrees(atan2(y, x)) % 360.0)
 
     return tuple(cusps)
 
 
+@lru_cache(maxsize=1024)
 def equal_cusps(start_n: int = 0, start_x: float = 0.0) -> tuple[float, ...]:
     """Base routine for equal systems.
 
@@ -257,7 +391,7 @@ def equal_cusps(start_n: int = 0, start_x: float = 0.0) -> tuple[float, ...]:
     cusps = [0] * 12
     for i in range(12):
         n = (start_n + i) % 12
-        cusps[n] = degrees(reduce_rad(start_x + _R30 * i))  # type: ignore
+        cusps[n] = degrees((start_x + _R30 * i) % _R360)  # type: ignore
     return tuple(cusps)
 
 
@@ -294,6 +428,23 @@ def equal_mc_cusps(mc: float) -> tuple[float, ...]:
     return equal_cusps(start_x=mc, start_n=9)
 
 
+def _house_bounds(cusps: tuple[float, ...]) -> tuple[int, list[float]]:
+    """Index of the lowest cusp and the cusps rotated to start from it.
+
+    Cusps go counter-clockwise, so the rotated list is sorted ascending.
+    """
+    p = min(range(len(cusps)), key=cusps.__getitem__)
+    return p, [*cusps[p:], *cusps[:p]]
+
+
+def _find_house(x: float, bounds: tuple[int, list[float]]) -> int:
+    p, rotated = bounds
+    r = (x + _HALF_SECOND) % 360.0
+    # before the lowest cusp means the last house, the one containing 0°
+    j = bisect_right(rotated, r) - 1
+    return (p + j) % len(rotated)
+
+
 def in_house(x: float, cusps: tuple[float, ...]) -> int:
     """Find in which house is a given point.
 
@@ -304,13 +455,21 @@ def in_house(x: float, cusps: tuple[float, ...]) -> int:
     Returns:
         int: index of a house
     """
-    r = reduce_deg(x + _HALF_SECOND)
-    result = 0
-    ln = len(cusps)
-    for i in range(ln):
-        a = cusps[i]
-        b = cusps[(i + 1) % ln]
-        if ((a <= r) and (r < b)) or (a > b and (r >= a or r < b)):
-            result = i
-            break
-    return result
+    return _find_house(x, _house_bounds(cusps))
+
+
+def in_houses(xs: Iterable[float], cusps: tuple[float, ...]) -> tuple[int, ...]:
+    """Find in which houses are given points.
+
+    Same as calling `in_house` for every point, but the house boundaries
+    are prepared only once.
+
+    Args:
+        xs (Iterable[float]): longitudes in arc-degrees
+        cusps (tuple[float, ...]): longitudes of 12 house cusps in arc-degrees
+
+    Returns:
+        tuple[int, ...]: indices of houses, in the order of the points
+    """
+    bounds = _house_bounds(cusps)
+    return tuple(_find_house(x, bounds) for x in xs)
@@ -6,14 +6,13 @@ __version__ = "0.0.1"
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
 
 from astropc.planets import EclipticPosition, PlanetId
 
 from .categories import Influence
 
 
-@dataclass
+@dataclass(eq=False)
 class ChartObjectMixin:
     index: int
     title: str
@@ -35,17 +34,12 @@ class ChartObjectType(ChartObjectMixin, Enum):
     PLUTO = 9, "Pluto", Influence.NEUTRAL
     NODE = 10, "Lunar Node", Influence.NEUTRAL
 
-    def __eq__(self, other: Any) -> Any:
-        if not isinstance(other, ChartObjectType):
-            return NotImplemented
-        return self.title == other.title
+    # members are singletons: hash by identity in C instead of Enum's
+    # Python-level hash of the member name
+    __hash__ = object.__hash__
 
-    def __hash__(self) -> int:
-        return hash(self.title)
 
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChartObjectInfo:
     """Object position in chart."""
 
@@ -72,5 +66,5 @@ PLANET_TO_OBJECT: dict[PlanetId, ChartObjectType] = {
     PlanetId.SATURN: ChartObjectType.SATURN,
     PlanetId.URANUS: ChartObjectType.URANUS,
     PlanetId.NEPTUNE: ChartObjectType.NEPTUNE,
-    PlanetId.PLUTO: ChartObjectType.PLUTO
-}
\ No newline at end of file
+    PlanetId.PLUTO: ChartObjectType.PLUTO,
+}
@@ -10,14 +10,13 @@ __version__ = "0.0.1"
 from collections import namedtuple
 from math import atan2, cos, pi, sin, tan
 
-from astropc.mathutils import reduce_rad
-
 
 SensitivePoints = namedtuple("SensitivePoints", "asc mc vertex eastpoint")
 
 
 
 _R90 = 1.5707963267948966  # 90 deg in radians
+_R360 = 6.283185307179586  # 360 deg in radians
 
 
 def midheaven(ramc: float, eps: float) -> float:
@@ -39,7 +38,7 @@ def midheaven(ramc: float, eps: float) -> float:
     if sin(ramc) < 0:
         x += pi
 
-    return reduce_rad(x)
+    return x % _R360
 
 
 def ascendant(ramc: float, eps: float, theta: float) -> float:
@@ -55,7 +54,7 @@ def ascendant(ramc: float, eps: float, theta: float) -> float:
     Returns:
         float:  Ascendant, in radians.
     """
-    return reduce_rad(atan2(cos(ramc), -sin(ramc) * cos(eps) - tan(theta) * sin(eps)))
+    return atan2(cos(ramc), -sin(ramc) * cos(eps) - tan(theta) * sin(eps)) % _R360
 
 
 def vertex(ramc: float, eps: float, theta: float) -> float:
@@ -87,4 +86,32 @@ def eastpoint(ramc: float, eps: float) -> float:
     Returns:
         float: East Point longitude, in radians.
     """
-    return reduce_rad(atan2(cos(ramc), -sin(ramc) * cos(eps)))
+    return atan2(cos(ramc), -sin(ramc) * cos(eps)) % _R360
+
+
+def all_points(ramc: float, eps: float, theta: float) -> SensitivePoints:
+    """All sensitive points at once.
+
+    Same as calling `ascendant`, `midheaven`, `vertex` and `eastpoint`,
+    but sines and cosines of RAMC and the obliquity are computed only once.
+
+    Args:
+        ramc (float): right ascension of the meridian, in radians.
+        eps (float): Ecliptic obliquity, in radians.
+        theta (float): geographical latitude, in radians, positive northwards.
+
+    Returns:
+        SensitivePoints: longitudes of the points, in radians.
+    """
+    sn_r = sin(ramc)
+    cs_r = cos(ramc)
+    sn_e = sin(eps)
+    cs_e = cos(eps)
+    x = sn_r * cs_e
+    # Vertex is the Ascendant for RAMC + 180° and the co-latitude
+    return SensitivePoints(
+        asc=atan2(cs_r, -x - tan(theta) * sn_e) % _R360,
+        mc=atan2(sn_r, cs_r * cs_e) % _R360,
+        vertex=atan2(-cs_r, x - tan(_R90 - theta) * sn_e) % _R360,
+        eastpoint=atan2(cs_r, -x) % _R360,
+    )
@@ -1,7 +1,7 @@
 from astropc.planets import EclipticPosition
 from pytest import fixture
 
-from astrologer.aspects import Aspect, find_closest_aspect, iter_stelliums
+from astrologer.aspects import Aspect, find_closest_aspect, iter_aspects, iter_stelliums
 from astrologer.objects import ChartObjectInfo, ChartObjectType
 
 
@@ -19,6 +19,43 @@ def test_find_closest_aspect():
     assert info.aspect == Aspect.CONJUNCTION
 
 
+def test_find_closest_aspect_with_arc():
+    info = find_closest_aspect(
+        ChartObjectInfo(
+            type=ChartObjectType.MOON,
+            position=EclipticPosition(lmbda=310.0),
+        ),
+        ChartObjectInfo(
+            type=ChartObjectType.SUN,
+            position=EclipticPosition(lmbda=312.0),
+        ),
+        arc=2.0,
+    )
+    assert info.aspect == Aspect.CONJUNCTION
+    assert info.delta == 2.0
+
+
+def test_iter_aspects():
+    moon = ChartObjectInfo(
+        type=ChartObjectType.MOON, position=EclipticPosition(lmbda=310.0)
+    )
+    sun = ChartObjectInfo(
+        type=ChartObjectType.SUN, position=EclipticPosition(lmbda=312.0)
+    )
+    mars = ChartObjectInfo(
+        type=ChartObjectType.MARS, position=EclipticPosition(lmbda=40.0)
+    )
+    got = [
+        (src.type, dst.type, info.aspect)
+        for src, dst, info in iter_aspects((moon, sun, mars))
+    ]
+    assert got == [
+        (ChartObjectType.MOON, ChartObjectType.SUN, Aspect.CONJUNCTION),
+        (ChartObjectType.MOON, ChartObjectType.MARS, Aspect.SQUARE),
+        (ChartObjectType.SUN, ChartObjectType.MARS, Aspect.SQUARE),
+    ]
+
+
 class TestStelliums:
     @fixture()
     def objects(self):
@@ -119,3 +156,23 @@ class TestStelliums:
     def test_stelliums_around_zero(self, objects_around_zero):
         groups = list(iter_stelliums(objects_around_zero))
         assert len(groups) == 6
+
+    @staticmethod
+    def _make(*lons):
+        return tuple(
+            ChartObjectInfo(type=obj_type, position=EclipticPosition(lmbda=lmbda))
+            for obj_type, lmbda in zip(ChartObjectType, lons)
+        )
+
+    def test_stelliums_with_single_object(self):
+        objs = self._make(100.0)
+        assert list(iter_stelliums(objs)) == [objs]
+
+    def test_stelliums_straddling_zero(self):
+        moon, sun = self._make(355.0, 3.0)
+        assert list(iter_stelliums((sun, moon))) == [(moon, sun)]
+
+    def test_stelliums_with_gap_over_half_circle(self):
+        moon, sun, mercury = self._make(10.0, 12.0, 250.0)
+        groups = list(iter_stelliums((moon, sun, mercury)))
+        assert sorted(groups, key=len) == [(mercury,), (moon, sun)]
@@ -1,26 +1,74 @@
-from pytest import approx, fixture, mark
-
-from astrologer import objects
-from astrologer.charts import Place, Radix
+from dataclasses import FrozenInstanceError
 
+from pytest import approx, fixture, mark, raises
 
-@fixture()
+from astrologer import objects
+from astrologer.aspects import AspectType
+from astrologer.charts import (
+    BaseChart,
+    ChartType,
+    Place,
+    Radix,
+    Settings,
+    _cached_bodies,
+    _cached_node,
+    _cached_sphera,
+)
+
+
+@fixture(scope="module")
 def place():
     return Place(name="Test Place", latitude=55.75, longitude=-37.58)
 
 
-@fixture()
+@fixture(scope="module")
 def djd():
     return 3772.990277
 
 
+@fixture(scope="module")
+def radix(place):
+    return Radix("Test Radix", djd=23772.990277, place=place)
+
+
+def test_settings_aspect_types():
+    settings = Settings(aspect_types=AspectType.MAJOR | AspectType.MINOR)
+    assert settings.aspect_types == AspectType.MAJOR | AspectType.MINOR
+    assert Settings().aspect_types == AspectType.MAJOR
+    with raises(FrozenInstanceError):
+        settings.true_node = False
+
+
+def test_base_chart_is_abstract():
+    with raises(TypeError):
+        BaseChart("Test", ChartType.RADIX)
+
+
+def test_bulk_objects(djd, place):
+    djds = [djd + i for i in range(3)]
+    got = Radix.bulk_objects(djds, place)
+    assert len(got) == len(djds)
+    for objs, x in zip(got, djds):
+        for cached in (_cached_bodies, _cached_node, _cached_sphera):
+            cached.cache_clear()
+        expected = Radix("Test", djd=x, place=place).objects
+        assert list(objs) == list(expected)
+        for k, obj in objs.items():
+            assert obj.position.lmbda == approx(expected[k].position.lmbda)
+            assert obj.daily_motion == approx(expected[k].daily_motion)
+            assert obj.house == expected[k].house
+
+
+def test_charts_do_not_share_positions(djd, place):
+    first = Radix("First", djd=djd, place=place).objects
+    second = Radix("Second", djd=djd, place=place).objects
+    for k, obj in first.items():
+        assert obj.position is not second[k].position
+
+
 class TestRadix:
     delta = 1e-4
 
-    @fixture
-    def radix(self, djd, place):
-        return Radix("Test Radix", djd=23772.990277, place=place)
-
     def test_objects_exist(self, radix):
         assert radix.objects is not None
 
@@ -68,6 +116,13 @@ class TestRadix:
         aspects = radix.aspects
         assert len(aspects) == 10
 
+    def test_aspects_flat(self, radix):
+        table = radix.aspects
+        flat = radix.aspects_flat
+        assert sum(len(row) for row in table.values()) == 2 * len(flat)
+        for src, dst, asp in flat:
+            assert table[src][dst] is asp
+
     def test_aspects_symmetry(self, radix):
         aspects = radix.aspects
         assert (
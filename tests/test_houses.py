@@ -2,12 +2,14 @@ from math import degrees, radians
 
 from pytest import approx, fixture, mark, raises
 
+from astrologer import houses
 from astrologer.houses import (
     HousesSystem,
     campanus_cusps,
     equal_asc_cusps,
     equal_mc_cusps,
     in_house,
+    in_houses,
     koch_cusps,
     morinus_cusps,
     placidus_cusps,
@@ -19,30 +21,38 @@ from astrologer.houses import (
 
 _DELTA = 1e-3
 
+_RAMC = radians(45.0)
+_MC = radians(47.47)
+_ASC = radians(144.92)
+_THETA = radians(42.0)
+_EPS = radians(23.4523)
+_MORINUS_RAMC = radians(345.559001)
+_MORINUS_EPS = radians(23.430827)
+
 
 @fixture()
 def ramc():
-    return radians(45.0)
+    return _RAMC
 
 
 @fixture()
 def mc():
-    return radians(47.47)
+    return _MC
 
 
 @fixture()
 def asc():
-    return radians(144.92)
+    return _ASC
 
 
 @fixture()
 def theta():
-    return radians(42.0)
+    return _THETA
 
 
 @fixture()
 def eps():
-    return radians(23.4523)
+    return _EPS
 
 
 @fixture
@@ -81,6 +91,36 @@ def test_placidus(cusp, expected, ramc, eps, theta):
     assert approx(degrees(got[cusp]), rel=_DELTA) == expected
 
 
+@mark.parametrize(
+    "cusp, expected",
+    [(0, 98.843422), (1, 131.944084), (2, 170.102714), (3, 192.313205)],
+)
+def test_placidus_near_polar_circle(cusp, expected, ramc, eps):
+    # reference values come from the fixed-point iteration run to 1e-13
+    got = placidus_cusps(ramc=ramc, eps=eps, theta=radians(66.0))
+    assert degrees(got[cusp]) == approx(expected, abs=1e-6)
+
+
+@mark.parametrize("name, value", [("_PLAC_MAX_STEPS", 0), ("_PLAC_MIN_DENOM", 2.0)])
+def test_placidus_fixed_point_fallback(name, value, ramc, eps, theta, monkeypatch):
+    expected = placidus_cusps(ramc=ramc, eps=eps, theta=theta)
+    monkeypatch.setattr(houses, name, value)
+    got = placidus_cusps(ramc=ramc, eps=eps, theta=theta)
+    assert got == approx(expected, abs=1e-3)
+
+
+def test_placidus_fallback_does_not_converge(ramc, eps, theta, monkeypatch):
+    monkeypatch.setattr(houses, "_PLAC_MAX_STEPS", 0)
+    monkeypatch.setattr(houses, "_PLAC_MAX_FIXED_STEPS", 1)
+    with raises(ValueError, match="does not converge"):
+        placidus_cusps(ramc=ramc, eps=eps, theta=theta)
+
+
+def test_placidus_with_polar_latitude(ramc, eps):
+    with raises(ValueError):
+        placidus_cusps(ramc=ramc, eps=eps, theta=radians(80.0))
+
+
 @mark.parametrize(
     "cusp, expected",
     [(0, 86.55), (1, 119.56), (2, 167.79), (3, 193.66)],
@@ -151,8 +191,7 @@ def test_quadrant_cusps_with_invalid_latitude(ramc, eps):
     ],
 )
 def test_morinus_cusps(cusp, expected):
-
-    got = morinus_cusps(ramc=radians(345.559001), eps=radians(23.430827))
+    got = morinus_cusps(ramc=_MORINUS_RAMC, eps=_MORINUS_EPS)
     assert approx(got[cusp], rel=_DELTA) == expected
 
 
@@ -242,3 +281,8 @@ def test_equalmc_cusps(cusp, expected):
 )
 def test_in_house_with_valid_cusps(lng, house, cusps):
     assert in_house(lng, cusps) == house
+
+
+def test_in_houses(cusps):
+    lngs = (312.4208864, 297.0782202, 177.9665740, 46.9285345)
+    assert in_houses(lngs, cusps) == (7, 6, 3, 10)
@@ -7,6 +7,7 @@ from astrologer.aspects import (
     ClassicWithAspectRatio,
     Dariot,
     DeVore,
+    OrbsMethod,
 )
 from astrologer.objects import ChartObjectInfo, ChartObjectType
 
@@ -213,3 +214,19 @@ def test_classic_with_aspect_ratio(
     classic_with_aspect_ratio,
 ):
     assert classic_with_aspect_ratio.is_aspect(source, target, aspect) == result
+
+
+@mark.parametrize("arc", [0.0, 2.0, 29.0, 44.5, 58.0, 71.0, 94.0, 136.0, 151.0, 175.0])
+def test_classic_with_aspect_ratio_closest_aspect(arc, classic_with_aspect_ratio):
+    source = ChartObjectInfo(
+        type=ChartObjectType.SUN, position=EclipticPosition(lmbda=0.0)
+    )
+    target = ChartObjectInfo(
+        type=ChartObjectType.MARS, position=EclipticPosition(lmbda=arc)
+    )
+    aspects = tuple(Aspect)
+    got = classic_with_aspect_ratio.closest_aspect(source, target, aspects, arc)
+    expected = OrbsMethod.closest_aspect(
+        classic_with_aspect_ratio, source, target, aspects, arc
+    )
+    assert got == expected
@@ -2,22 +2,26 @@ from math import degrees, radians
 
 from pytest import approx, fixture
 
-from astrologer.points import ascendant, eastpoint, midheaven, vertex
+from astrologer.points import all_points, ascendant, eastpoint, midheaven, vertex
+
+_THETA = radians(55.75)
+_EPS = radians(23.44425561111111)
+_RAMC = radians(345.5553345833333)
 
 
 @fixture()
 def theta():
-    return radians(55.75)
+    return _THETA
 
 
 @fixture()
 def eps():
-    return radians(23.44425561111111)
+    return _EPS
 
 
 @fixture()
 def ramc():
-    return radians(345.5553345833333)
+    return _RAMC
 
 
 def test_midheaven(ramc, eps):
@@ -38,3 +42,11 @@ def test_vertex(ramc, eps, theta):
 def test_eastpoint(ramc, eps):
     got = degrees(eastpoint(ramc, eps))
     assert approx(got, abs=1e-4) == 76.70363
+
+
+def test_all_points(ramc, eps, theta):
+    got = all_points(ramc, eps, theta)
+    assert approx(got.asc) == ascendant(ramc, eps, theta)
+    assert approx(got.mc) == midheaven(ramc, eps)
+    assert approx(got.vertex) == vertex(ramc, eps, theta)
+    assert approx(got.eastpoint) == eastpoint(ramc, eps)